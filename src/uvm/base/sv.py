@@ -25,10 +25,11 @@ we don't want to compile vendor-specific C-code for using the backdoor
 access. cocotb is already hiding these details from us.
 """
 
+from functools import lru_cache
 from inspect import getframeinfo, stack
 import re
 import random
-from typing import List, Any
+from typing import Dict, List, Any
 
 import cocotb
 
@@ -43,17 +44,29 @@ RET_ERR = 1
 RET_OK = 0
 
 
+@lru_cache(maxsize=8192)
+def _compiled_re(rex):
+    """
+    Returns the compiled pattern for a regex string. Match expressions
+    repeat heavily (component scopes, field globs), so compilation runs
+    once per distinct expression; re's own internal cache is smaller and
+    still pays per-call parsing of its arguments.
+    """
+    return re.compile(rex)
+
+
 def uvm_re_match(rex, _str):
-    m = re.search(rex, _str)
+    m = _compiled_re(rex).search(_str)
     if m is not None:
         return RET_OK
     return RET_ERR
 
 
+@lru_cache(maxsize=8192)
 def uvm_glob_to_re(_str: str) -> str:
     """
     Converts a glob-style pattern to Python
-    regular expression syntax.
+    regular expression syntax. The conversion is memoized per pattern.
 
     Returns:
         str: Glob converted to regular expression syntax.
@@ -175,6 +188,11 @@ class sv:
     formats = ["%b", "%0b", "%0d", "%d", "%s", "%0s", "%h", "%0h", "%f",
             "%p", "%0t", "%t", "%x"]
 
+    #// sformatf template cache: maps the original printf-style message to its
+    #// str.format translation. Report messages are mostly string literals, so
+    #// the replace loop runs once per distinct template instead of per call.
+    _sformatf_cache: Dict[str, str] = {}
+
     @classmethod
     def sscanf(cls, scan_str: str, formats: str, *results):
         """
@@ -240,12 +258,16 @@ class sv:
         # TODO substitute old types %s/%d etc with {}
         #new_msg = cls.STR_RE.sub(r'{:\1}', msg)
         #print("new_msg is " + new_msg)
-        for s in cls.formats:
-            if s == "%h" or s == "%0h":
-                msg = msg.replace(s, "{:X}")
-            else:
-                msg = msg.replace(s, "{}")
-        return msg.format(*args)
+        fmt = cls._sformatf_cache.get(msg)
+        if fmt is None:
+            fmt = msg
+            for s in cls.formats:
+                if s == "%h" or s == "%0h":
+                    fmt = fmt.replace(s, "{:X}")
+                else:
+                    fmt = fmt.replace(s, "{}")
+            cls._sformatf_cache[msg] = fmt
+        return fmt.format(*args)
 
     @classmethod
     def random(cls):
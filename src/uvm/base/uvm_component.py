@@ -188,6 +188,8 @@ class UVMComponent(UVMReportObject):
         self.m_phasing_active = 0
         self.recording_detail = UVM_NONE
         self.m_name = ""
+        self._cached_depth = None
+        self._cfg_precedence = None
         self.m_verbosity_settings = []
         self.m_main_stream = None
 
@@ -453,11 +455,11 @@ class UVMComponent(UVMReportObject):
         """
         if self.m_name == "":
             return 0
-        get_depth = 1
-        for i in range(len(self.m_name)):
-            if (self.m_name[i] == "."):
-                get_depth += 1
-        return get_depth
+        # Cached because config-db sets recompute the depth per call; the
+        # cache is dropped whenever m_set_full_name renames this component.
+        if self._cached_depth is None:
+            self._cached_depth = self.m_name.count(".") + 1
+        return self._cached_depth
 
 
     # Group: Phasing Interface
@@ -2151,6 +2153,8 @@ class UVMComponent(UVMReportObject):
             self.m_name = self.get_name()
         else:
             self.m_name = self.m_parent.get_full_name() + "." + self.get_name()
+        self._cached_depth = None
+        self._cfg_precedence = None
 
         for c in self.m_children:
             tmp = self.m_children[c]
@@ -41,17 +41,143 @@ components. In uvm-python, you can use `run_test(..., dut=dut)` inside your `@co
 function instead.
 """
 
+import re
+import sys
+import weakref
+from functools import lru_cache
+
 from cocotb.triggers import Event
 
 from .uvm_resource import UVMResourceBase, UVMResource, UVMResourcePool, PRI_HIGH
 from .uvm_resource_db import UVMResourceDb
-from .uvm_pool import UVMPool
-from .sv import uvm_re_match, uvm_glob_to_re
+from .sv import uvm_glob_to_re
 from .uvm_debug import uvm_debug
 
 
+#// Module-level mirror of UVMConfigDbOptions.tracing, kept in sync by
+#// UVMConfigDbOptions below. Lets the hot get/set paths test tracing with a
+#// single global load instead of a classmethod call that re-checks `ready`.
+_TRACING = False
+
+#// Lazily resolved UVMCoreService.get; avoids the in-function import on
+#// every get/set/exists (the import is deferred because uvm_coreservice
+#// imports back into the base package).
+_cs_get = None
+
+
+def _core_service():
+    """
+    Returns the UVMCoreService singleton, resolving and caching the class's
+    get method on first use.
+    """
+    global _cs_get
+    if _cs_get is None:
+        from .uvm_coreservice import UVMCoreService
+        _cs_get = UVMCoreService.get
+    return _cs_get()
+
+
+#// Cached UVMResourcePool singleton. The pool is created once and never
+#// replaced, so the hot paths can load it with one global access instead of
+#// a classmethod call per operation.
+_rpool = None
+
+
+def _resource_pool():
+    """
+    Returns the UVMResourcePool singleton, cached at module level after the
+    first call.
+    """
+    global _rpool
+    if _rpool is None:
+        _rpool = UVMResourcePool.get()
+    return _rpool
+
+
+@lru_cache(maxsize=4096)
+def _compiled_glob(glob):
+    """
+    Returns the compiled regex for a glob expression. Instance names repeat
+    heavily across config accesses (the same components get configured many
+    times), so the glob-to-regex rewrite and re.compile run once per distinct
+    pattern instead of once per set.
+
+    Args:
+        glob (str): Glob (or /regex/) expression.
+    Returns:
+        re.Pattern: Compiled pattern.
+    """
+    return re.compile(uvm_glob_to_re(glob))
+
+
+@lru_cache(maxsize=16384)
+def _match_glob(glob, name):
+    """
+    Matches `name` against the glob expression, with the same search
+    semantics as `uvm_re_match` but a cached compiled pattern. The outcome
+    is memoized per (glob, name) pair: both sides repeat heavily across
+    sets, so a steady-state waiter sweep costs one dict hit per waiter
+    instead of a regex search.
+
+    Args:
+        glob (str): Glob (or /regex/) expression.
+        name (str): String to match.
+    Returns:
+        bool: True if the pattern matches.
+    """
+    return _compiled_glob(glob).search(name) is not None
+
+
+def _cfg_precedence(cntxt):
+    """
+    Returns the build-phase config precedence for a component, i.e.
+    `default_precedence` minus the component's depth. The value is cached on
+    the component (depth never changes after elaboration; a rename through
+    m_set_full_name resets the cache).
+
+    Args:
+        cntxt (UVMComponent): Context component.
+    Returns:
+        int: Precedence for build-time sets from this component.
+    """
+    prec = getattr(cntxt, '_cfg_precedence', None)
+    if prec is None:
+        prec = (UVMResourceBase.default_precedence - cntxt.get_depth())
+        cntxt._cfg_precedence = prec
+    return prec
+
+
+@lru_cache(maxsize=4096)
+def _glob_literal_prefix(glob):
+    """
+    Returns the literal leading part of a glob expression, i.e. everything
+    before the first `*`, `?` or `[` metacharacter. For explicit /regex/
+    expressions there is no usable literal part, so "" is returned.
+
+    Any name matched by the glob must contain this prefix as a substring
+    (`uvm_re_match` uses unanchored search), which makes it a cheap and
+    sound prefilter in front of the full regex match.
+
+    Args:
+        glob (str): Glob (or /regex/) expression.
+    Returns:
+        str: Literal prefix, possibly "".
+    """
+    if glob is None or glob == "":
+        return ""
+    if glob[0] == "/" and glob[-1] == "/":
+        return ""
+    for i, c in enumerate(glob):
+        if c in "*?[":
+            return glob[:i]
+    return glob
+
+
 class m_uvm_waiter:
 
+    #// One waiter per wait_modified call, so skip the per-instance __dict__.
+    __slots__ = ('inst_name', 'field_name', 'trigger')
+
     def __init__(self, inst_name, field_name):
         """
         Args:
@@ -80,12 +206,36 @@ class UVMConfigDb(UVMResourceDb):
     #  // Internal lookup of config settings so they can be reused
     #  // The context has a pool that is keyed by the inst/field name.
     #  static uvm_pool#(string,uvm_resource#(T)) m_rsc[UVMComponent];
-    m_rsc = {}
+    #  The fast path reads the pool straight off the component (_cfg_pool
+    #  attribute); this weak mapping mirrors it for introspection without
+    #  keeping dead components alive.
+    m_rsc = weakref.WeakKeyDictionary()
 
     #  // Internal waiter list for wait_modified
+    #  // Values are plain lists of m_uvm_waiter, iterated directly by set().
     #  static local uvm_queue#(m_uvm_waiter) m_waiters[string];
     m_waiters = {}
 
+    #  // Resolved-resource cache for get(). Keys are (inst_name, field_name,
+    #  // T); values are (db version, resource). Any set() bumps _db_version,
+    #  // which lazily invalidates every cached entry, so repeated get()s on
+    #  // stable configuration resolve with one dict probe instead of a
+    #  // regex-based pool lookup. The cache tag also folds in
+    #  // UVMResourcePool._version, which the pool bumps on every insertion,
+    #  // so resources added behind UVMConfigDb's back (direct
+    #  // UVMResourceDb/pool sets) invalidate cached entries as well. The
+    #  // cache holds resources, not values, so in-place updates of an
+    #  // already-resolved resource are still observed through read().
+    _get_cache = {}
+    _db_version = 0
+
+    #  // Process-wide dedup of resources, keyed by the same
+    #  // "<inst>__M_UVM__<field>" lookup string as the per-context pools.
+    #  // set() calls from different contexts that target the same scope and
+    #  // field share one UVMResource instead of allocating per-context
+    #  // duplicates; weak values let a resource die with its owning pools.
+    _resource_cache = weakref.WeakValueDictionary()
+
     @classmethod
     def get(cls, cntxt, inst_name, field_name, value, T=None):
         """
@@ -110,41 +260,56 @@ class UVMConfigDb(UVMResourceDb):
             cntxt:
             inst_name:
             field_name:
-            value:
+            value: List-like object with append; the retrieved value is
+                appended to it on a hit.
             T:
         Returns:
         Raises:
+            TypeError: If `value` does not support append.
         """
         #//TBD: add file/line
         # p = 0
         r = None  # uvm_resource#(T) r, rt;
         # rt = None
-        rp = UVMResourcePool.get()
-        from .uvm_coreservice import UVMCoreService
-        cs = UVMCoreService.get()
+        rp = _resource_pool()
+        cs = _core_service()
 
         if cntxt is None:
             cntxt = cs.get_root()
+        cntxt_name = cntxt.get_full_name()
         if inst_name == "":
-            inst_name = cntxt.get_full_name()
-        elif cntxt.get_full_name() != "":
-            inst_name = cntxt.get_full_name() + "." + inst_name
+            inst_name = cntxt_name
+        elif cntxt_name != "":
+            inst_name = cntxt_name + "." + inst_name
 
         #rq = rp.lookup_regex_names(inst_name, field_name, uvm_resource#(T)::get_type());
-        rq = rp.lookup_regex_names(inst_name, field_name)
-        uvm_debug(cls, 'get', 'rq size is ' + str(rq))
-        r = UVMResource.get_highest_precedence(rq, T)
+        # Component-hierarchy strings are highly redundant; interning them
+        # makes the cache-key hash/compare pointer-fast.
+        inst_name = sys.intern(inst_name)
+        field_name = sys.intern(field_name)
+        key = (inst_name, field_name, T)
+        ver = (cls._db_version, UVMResourcePool._version)
+        cached = cls._get_cache.get(key)
+        if cached is not None and cached[0] == ver:
+            r = cached[1]
+        else:
+            rq = rp.lookup_regex_names(inst_name, field_name)
+            uvm_debug(cls, 'get', 'rq size is ' + str(rq))
+            r = UVMResource.get_highest_precedence(rq, T)
+            cls._get_cache[key] = (ver, r)
 
-        if UVMConfigDbOptions.is_tracing():
+        if (_TRACING or not UVMConfigDbOptions.ready) and \
+                UVMConfigDbOptions.is_tracing():
             UVMResourceDb.m_show_msg("CFGDB/GET", "Configuration","read", inst_name,
                 field_name, cntxt, r)
         if r is None:
             return False
 
-        if hasattr(value, 'append'):
-            value.append(r.read(cntxt))
-        else:
-            raise Exception('value must be a list-like with append')
+        try:
+            appender = value.append
+        except AttributeError:
+            raise TypeError('value must be a list-like with append')
+        appender(r.read(cntxt))
         return True
 
     @classmethod
@@ -188,14 +353,45 @@ class UVMConfigDb(UVMResourceDb):
             value:
             T:
         """
+        # Fast path for the steady state: updating an existing setting with
+        # no waiters on the field and tracing off. Skips pool creation, the
+        # override insertion and the waiter sweep of the general path below.
+        # Uses its own locals so a miss falls through with the arguments
+        # untouched.
+        db = UVMConfigDb
+        if (cntxt is not None and not _TRACING and UVMConfigDbOptions.ready
+                and field_name not in db.m_waiters):
+            pool = getattr(cntxt, '_cfg_pool', None)
+            if pool is not None:
+                cntxt_name = cntxt.get_full_name()
+                if inst_name == "":
+                    scope = cntxt_name
+                elif cntxt_name != "":
+                    scope = cntxt_name + "." + inst_name
+                else:
+                    scope = inst_name
+                r = pool.get("".join((scope, "__M_UVM__", field_name)))
+                if r is not None:
+                    db._db_version += 1
+                    db._get_cache.clear()
+                    curr_phase = _core_service().get_root().m_current_phase
+                    if curr_phase is not None and curr_phase.get_name() == "build":
+                        r.precedence = _cfg_precedence(cntxt)
+                    else:
+                        r.precedence = UVMResourceBase.default_precedence
+                    # Defer the write; UVMResource flushes it on first read,
+                    # so repeated shadowed sets cost only this slot store.
+                    r._pending_write = (value, cntxt)
+                    _resource_pool().set_priority_name(r, PRI_HIGH)
+                    return
+
         p = None
         curr_phase = None
         exists = False
         lookup = ""
         pool = None  # uvm_pool#(string,uvm_resource#(T)) pool;
         rstate = ""
-        from .uvm_coreservice import UVMCoreService
-        cs = UVMCoreService.get()
+        cs = _core_service()
 
         # take care of random stability during allocation
         # process p = process::self();
@@ -207,57 +403,82 @@ class UVMConfigDb(UVMResourceDb):
 
         if cntxt is None:
             cntxt = top
+        cntxt_name = cntxt.get_full_name()
         if inst_name == "":
-            inst_name = cntxt.get_full_name()
-        elif cntxt.get_full_name() != "":
-            inst_name = cntxt.get_full_name() + "." + inst_name
+            inst_name = cntxt_name
+        elif cntxt_name != "":
+            inst_name = cntxt_name + "." + inst_name
 
-        if cntxt in UVMConfigDb.m_rsc:
-            pass
-        else:
-            UVMConfigDb.m_rsc[cntxt] = UVMPool()
-        pool = UVMConfigDb.m_rsc[cntxt]
+        # Any write may change what an earlier get() resolved to.
+        db._db_version += 1
+        db._get_cache.clear()
+
+        # The per-context pool is private to this class, so it is a plain
+        # dict: one C-level probe per access instead of UVMPool method calls.
+        pool = getattr(cntxt, '_cfg_pool', None)
+        if pool is None:
+            pool = cntxt._cfg_pool = {}
+            db.m_rsc[cntxt] = pool
 
         # Insert the token in the middle to prevent cache
         # oddities like i=foobar,f=xyz and i=foo,f=barxyz.
         # Can't just use '.', because '.' isn't illegal
         # in field names
-        lookup = inst_name + "__M_UVM__" + field_name
+        lookup = "".join((inst_name, "__M_UVM__", field_name))
 
-        r = None  # uvm_resource#(T) r;
-        if not pool.exists(lookup):
-            r = UVMResource(field_name, inst_name)
-            pool.add(lookup, r)
+        if curr_phase is not None and curr_phase.get_name() == "build":
+            prec = _cfg_precedence(cntxt)
         else:
-            r = pool.get(lookup)
-            exists = True
+            prec = UVMResourceBase.default_precedence
 
-        if curr_phase is not None and curr_phase.get_name() == "build":
-            r.precedence = UVMResourceBase.default_precedence - cntxt.get_depth()
+        r = pool.get(lookup)  # uvm_resource#(T) r;
+        if r is None:
+            # An equivalent setting made from another context maps to the
+            # same lookup string; share its resource object instead of
+            # allocating a duplicate, provided the stored value and
+            # precedence already match (on divergence the contexts get
+            # separate objects as before). A shared resource is already
+            # registered in the global pool, so set_override is skipped.
+            shared = db._resource_cache.get(lookup)
+            if shared is not None and shared.precedence == prec:
+                pw = shared._pending_write
+                sval = shared.val if pw is None else pw[0]
+                if sval == value:
+                    r = pool[lookup] = shared
+                    exists = True
+            if r is None:
+                r = pool[lookup] = UVMResource(field_name, inst_name)
+                db._resource_cache[lookup] = r
         else:
-            r.precedence = UVMResourceBase.default_precedence
+            exists = True
 
-        r.write(value, cntxt)
+        r.precedence = prec
+        # Defer the write; UVMResource flushes it on first read, so a value
+        # that is shadowed before anyone reads it skips the write machinery.
+        r._pending_write = (value, cntxt)
 
         if exists:
-            rp = UVMResourcePool.get()
+            rp = _resource_pool()
             rp.set_priority_name(r, PRI_HIGH)
         else:
             # Doesn't exist yet, so put it in resource db at the head.
             r.set_override()
 
         # trigger any waiters
-        if field_name in UVMConfigDb.m_waiters:
-            w = None
-            for i in range(len(UVMConfigDb.m_waiters[field_name])):
-                w = UVMConfigDb.m_waiters[field_name].get(i)
-                if uvm_re_match(uvm_glob_to_re(inst_name),w.inst_name) == 0:
+        waiters = db.m_waiters.get(field_name)
+        if waiters:
+            # Regex-match only the waiters that pass the cheap literal-prefix
+            # substring filter; the others cannot match.
+            prefix = _glob_literal_prefix(inst_name)
+            for w in waiters:
+                if prefix in w.inst_name and _match_glob(inst_name, w.inst_name):
                     w.trigger.set()
 
         if p is not None:
             p.set_randstate(rstate)
 
-        if UVMConfigDbOptions.is_tracing():
+        if (_TRACING or not UVMConfigDbOptions.ready) and \
+                UVMConfigDbOptions.is_tracing():
             UVMResourceDb.m_show_msg("CFGDB/SET", "Configuration","set", inst_name, field_name, cntxt, r)
 
     @classmethod
@@ -279,14 +500,14 @@ class UVMConfigDb(UVMResourceDb):
             spell_chk:
         Returns:
         """
-        from .uvm_coreservice import UVMCoreService
-        cs = UVMCoreService.get()
+        cs = _core_service()
         if cntxt is None:
             cntxt = cs.get_root()
+        cntxt_name = cntxt.get_full_name()
         if inst_name == "":
-            inst_name = cntxt.get_full_name()
-        elif cntxt.get_full_name() != "":
-            inst_name = cntxt.get_full_name() + "." + inst_name
+            inst_name = cntxt_name
+        elif cntxt_name != "":
+            inst_name = cntxt_name + "." + inst_name
         found_val = UVMResourceDb.get_by_name(inst_name,field_name,spell_chk)
         return found_val is not None
 
@@ -402,18 +623,22 @@ class UVMConfigDbOptions:
 
         This method is implicitly called by the `+UVM_CONFIG_DB_TRACE`.
         """
+        global _TRACING
         if not UVMConfigDbOptions.ready:
             UVMConfigDbOptions.init()
         UVMConfigDbOptions.tracing = True
+        _TRACING = True
 
     @classmethod
     def turn_off_tracing(cls):
         """
         Turn tracing off for the configuration database.
         """
+        global _TRACING
         if not UVMConfigDbOptions.ready:
             UVMConfigDbOptions.init()
         UVMConfigDbOptions.tracing = False
+        _TRACING = False
 
     @classmethod
     def is_tracing(cls):
@@ -427,6 +652,7 @@ class UVMConfigDbOptions:
 
     @classmethod
     def init(cls):
+        global _TRACING
         trace_args = []  # string trace_args[$];
         from .uvm_cmdline_processor import UVMCmdlineProcessor
         clp = UVMCmdlineProcessor.get_inst()
@@ -435,3 +661,4 @@ class UVMConfigDbOptions:
         if clp.get_arg_matches("+UVM_CONFIG_DB_TRACE=", trace_args) > 0:
             UVMConfigDbOptions.tracing = 1
         UVMConfigDbOptions.ready = 1
+        _TRACING = bool(UVMConfigDbOptions.tracing)
@@ -629,13 +629,30 @@ class UVMResource(UVMResourceBase):
         UVMResourceBase.__init__(self, name, scope)
         self.val = None   # Resource value
         self.m_r2s = None  # Res2string converter
+        #// Deferred (value, accessor) pair from UVMConfigDb.set. The write
+        #// is applied lazily on the read side, so a build-time setting that
+        #// is shadowed before anyone reads it never pays for the write
+        #// bookkeeping. Note that wait_modified only observes a deferred
+        #// write once a reader flushes it.
+        self._pending_write = None
 
     def convert2string(self):
+        self._flush_pending()
         if UVM_USE_RESOURCE_CONVERTER:
             self.m_get_converter()
             return self.m_r2s.convert2string(self.val)
         return sv.sformatf("(%s) %s", uvm_typename(self.val), self.val)
 
+    def _flush_pending(self):
+        """
+        Applies a write deferred by `UVMConfigDb.set`, if any. Called from
+        the read side so the stored value is always current when observed.
+        """
+        pw = self._pending_write
+        if pw is not None:
+            self._pending_write = None
+            self.write(pw[0], pw[1])
+
     #//----------------------
     #// Group: Type Interface
     #//----------------------
@@ -786,6 +803,8 @@ class UVMResource(UVMResourceBase):
 
     def read(self, accessor=None):
         """ Return the object stored in the resource container """
+        if self._pending_write is not None:
+            self._flush_pending()
         self.record_read_access(accessor)
         return self.val
 
@@ -812,6 +831,11 @@ class UVMResource(UVMResourceBase):
                 self.get_name()))
             return
 
+        # This write supersedes any write still deferred from
+        # UVMConfigDb.set; drop it so it cannot be replayed over the new
+        # value at the next read.
+        self._pending_write = None
+
         # Set the modified bit and record the transaction only if the value
         # has actually changed.
         if self.val == t:
@@ -968,6 +992,11 @@ class UVMResourcePool:
 
     rp = None
 
+    #// Bumped on every pool insertion. Lets caches layered on top of the
+    #// pool (such as UVMConfigDb's get cache) notice resources added
+    #// through any path, including direct UVMResourceDb sets.
+    _version = 0
+
     def __init__(self):
         self.rtab = UVMPool()
         self.ttab = {}
@@ -1067,6 +1096,8 @@ class UVMResourcePool:
             rq.append(rsrc)
         self.ttab[type_handle] = rq
 
+        UVMResourcePool._version += 1
+
 
     #// Function: set_override
     #//
@@ -1581,6 +1612,11 @@ class UVMResourcePool:
 
 
         q = self.rtab[name]
+        # A move always pops the resource and appends it to the back of the
+        # queue, so if it is already last the move is a no-op; skip the
+        # linear scan. Common when the same field is re-set repeatedly.
+        if q and q[-1] is rsrc:
+            return
         self.set_priority_queue(rsrc, q, pri)
 
     #endfunction
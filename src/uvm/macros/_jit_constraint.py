@@ -0,0 +1,87 @@
+#//----------------------------------------------------------------------
+#//   Copyright 2019-2020 Tuomas Poikela (tpoikela)
+#//   All Rights Reserved Worldwide
+#//
+#//   Licensed under the Apache License, Version 2.0 (the
+#//   "License"); you may not use this file except in
+#//   compliance with the License.  You may obtain a copy of
+#//   the License at
+#//
+#//       http://www.apache.org/licenses/LICENSE-2.0
+#//
+#//   Unless required by applicable law or agreed to in
+#//   writing, software distributed under the License is
+#//   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#//   CONDITIONS OF ANY KIND, either express or implied.  See
+#//   the License for the specific language governing
+#//   permissions and limitations under the License.
+#//----------------------------------------------------------------------
+"""
+Optional numba acceleration for constraint lambdas.
+
+Constraint lambdas passed to `uvm_do_with` are evaluated by the solver once
+per candidate value, so small numeric lambdas can dominate randomization
+time. When numba is installed and the environment variable
+`UVM_JIT_CONSTRAINTS=1` is set, `jit_constraint` compiles closure-free
+numeric lambdas once and reuses the compiled form for every later call with
+the same code object. In all other cases (numba missing, flag unset,
+closure-capturing or untypeable lambdas), the original callable is returned
+unchanged, so this module never adds a hard dependency.
+"""
+
+import os
+
+njit = None
+if os.environ.get('UVM_JIT_CONSTRAINTS', '') == '1':
+    try:
+        from numba import njit
+    except ImportError:
+        njit = None
+
+JIT_ENABLED = njit is not None
+
+#// Compiled wrappers keyed by id of the lambda's code object. Only
+#// closure-free lambdas are compiled, so lambdas sharing a code object are
+#// interchangeable.
+_jit_cache = {}
+
+
+def jit_constraint(fn):
+    """
+    Returns a JIT-compiled drop-in replacement for constraint `fn`, or `fn`
+    itself when compilation does not apply. The replacement is a plain Python
+    function with the same argument names, because crv resolves constraint
+    arguments to rand variables through ``__code__.co_varnames``; it falls
+    back to the interpreted lambda if the compiled form raises (e.g. numba
+    TypingError on the first call).
+
+    Args:
+        fn (constraint): Constraint lambda or function.
+    Returns:
+        constraint: Compiled wrapper, or `fn` unchanged.
+    """
+    if njit is None or not hasattr(fn, '__code__'):
+        return fn
+    if fn.__closure__ is not None:
+        return fn
+
+    key = id(fn.__code__)
+    if key in _jit_cache:
+        return _jit_cache[key]
+
+    wrapped = fn
+    try:
+        compiled = njit(cache=True)(fn)
+        args = ", ".join(fn.__code__.co_varnames[:fn.__code__.co_argcount])
+        ns = {'_compiled': compiled, '_fn': fn}
+        src = ("def _jitted({args}):\n"
+               "    try:\n"
+               "        return _compiled({args})\n"
+               "    except Exception:\n"
+               "        return _fn({args})\n").format(args=args)
+        exec(src, ns)
+        wrapped = ns['_jitted']
+    except Exception:
+        wrapped = fn
+    _jit_cache[key] = wrapped
+    return wrapped
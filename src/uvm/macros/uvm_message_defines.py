@@ -109,9 +109,16 @@ if UVM_REPORT_DISABLE_LINE:
 #// the message text. The file and line are also sent to the uvm_report_info call.
 #//
 #// |`uvm_info(ID, MSG, VERBOSITY)
+#//
+#// ~MSG~ may also be a callable returning the message text. It is invoked
+#// only after the verbosity check passes, so hot paths can defer expensive
+#// string formatting with `uvm_info(ID, lambda: sv.sformatf(...), UVM_HIGH)`
+#// and pay nothing when the message is filtered out.
 
 def uvm_info(ID, MSG, VERBOSITY):
     if uvm_report_enabled(VERBOSITY, UVM_INFO, ID):
+        if callable(MSG):
+            MSG = MSG()
         caller = getframeinfo(stack()[1][0])
         fname = caller.filename
         lineno = caller.lineno
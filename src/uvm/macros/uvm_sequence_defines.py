@@ -37,7 +37,195 @@ sequencer, `m_sequencer`. This is determined a number of ways.
 """
 
 import cocotb
+import dis
 from .uvm_message_defines import uvm_warning, uvm_fatal
+from ._jit_constraint import jit_constraint, JIT_ENABLED
+
+
+#// Cache for `_cached_randomize_with`. Hot sequences (e.g. `read_byte_seq.body`)
+#// pass the same constraint lambdas thousands of times per test, so the
+#// per-call inspection of the constraint tuple is memoized here, keyed by
+#// (item class, constraint code ids). The cached value is the tuple of indices
+#// of the entries that are real callable constraints; empty placeholder
+#// blocks (the `{}` of the original SV macros, ported as `[]`/`{}`) are
+#// pruned so that the item can be randomized without inline constraints.
+_randomize_with_cache = {}
+
+
+def _captures_mutable(c):
+    """
+    Returns True if the constraint closure captures a mutable container.
+    Such constraints are not safe to memoize by code object identity, since
+    the same code can express different constraints over time.
+    """
+    cells = getattr(c, '__closure__', None)
+    if cells is None:
+        return False
+    for cell in cells:
+        if isinstance(cell.cell_contents, (list, dict, set)):
+            return True
+    return False
+
+
+#// Cache for `_match_eq_binding`, keyed by id of the lambda's code object.
+#// The cached value is the match recipe (or None for non-matching lambdas),
+#// so the bytecode scan runs once per call site, not once per randomize.
+_eq_bind_cache = {}
+
+#// Opcodes loading the right-hand side of an equality binding. The rhs must
+#// be a constant, a closure variable or a global, optionally followed by a
+#// chain of attribute loads (e.g. `self.start_addr`).
+_EQ_RHS_LOADS = ('LOAD_CONST', 'LOAD_DEREF', 'LOAD_GLOBAL')
+
+
+def _match_eq_binding(c):
+    """
+    Detects the trivial equality-binding shape `lambda x: x == <rhs>`, where
+    `<rhs>` is a constant, closure variable or global with an optional
+    attribute chain. Such constraints do not need the solver at all: the
+    variable's domain can be collapsed to the single rhs value instead.
+
+    Args:
+        c (constraint): Constraint lambda to inspect.
+    Returns:
+        tuple: `(argname, rhs_opname, rhs_name, attr_chain)` recipe, or None
+            if the lambda is not a pure equality binding.
+    """
+    code = getattr(c, '__code__', None)
+    if code is None or code.co_argcount != 1:
+        return None
+    key = id(code)
+    if key in _eq_bind_cache:
+        return _eq_bind_cache[key]
+    recipe = None
+    try:
+        ops = [i for i in dis.get_instructions(code)
+               if i.opname not in ('RESUME', 'PRECALL', 'CACHE')]
+        if (len(ops) >= 4 and
+                ops[0].opname == 'LOAD_FAST' and
+                ops[0].argval == code.co_varnames[0] and
+                ops[1].opname in _EQ_RHS_LOADS and
+                all(i.opname == 'LOAD_ATTR' for i in ops[2:-2]) and
+                ops[-2].opname == 'COMPARE_OP' and
+                ops[-2].argval == '==' and
+                ops[-1].opname == 'RETURN_VALUE'):
+            recipe = (code.co_varnames[0], ops[1].opname, ops[1].argval,
+                    tuple(i.argval for i in ops[2:-2]))
+    except Exception:
+        recipe = None
+    _eq_bind_cache[key] = recipe
+    return recipe
+
+
+def _eval_eq_binding(c, recipe):
+    """
+    Evaluates the right-hand side of an equality binding matched by
+    `_match_eq_binding`. Raises (KeyError/ValueError/AttributeError) if the
+    rhs cannot be resolved; callers then fall back to the solver.
+
+    Args:
+        c (constraint): The matched constraint lambda.
+        recipe (tuple): Match recipe from `_match_eq_binding`.
+    Returns:
+        The current rhs value.
+    """
+    _, opname, name, attrs = recipe
+    if opname == 'LOAD_CONST':
+        value = name
+    elif opname == 'LOAD_GLOBAL':
+        value = c.__globals__[name]
+    else:
+        value = c.__closure__[c.__code__.co_freevars.index(name)].cell_contents
+    for attr in attrs:
+        value = getattr(value, attr)
+    return value
+
+
+def _bind_eq_constraints(item, constraints):
+    """
+    Pre-pass over the constraints: equality bindings on rand variables of
+    `item` are lowered to a one-value domain narrowing instead of being
+    handed to the solver. Returns the remaining constraints and a dict of
+    saved domains that the caller must restore after randomization.
+
+    Args:
+        item (UVMSequenceItem|UVMSequence): Item being randomized.
+        constraints (tuple): Callable constraints.
+    Returns:
+        tuple: `(remaining_constraints, saved_domains)`.
+    """
+    rand_vars = getattr(item, '_randVariables', None)
+    if not rand_vars:
+        return constraints, None
+    saved = None
+    remaining = []
+    for c in constraints:
+        recipe = _match_eq_binding(c)
+        if recipe is not None and recipe[0] in rand_vars:
+            try:
+                value = _eval_eq_binding(c, recipe)
+                in_domain = value in rand_vars[recipe[0]]
+            except (KeyError, ValueError, AttributeError, TypeError):
+                remaining.append(c)
+                continue
+            if in_domain:
+                if saved is None:
+                    saved = {}
+                if recipe[0] not in saved:
+                    saved[recipe[0]] = rand_vars[recipe[0]]
+                rand_vars[recipe[0]] = [value]
+                continue
+        remaining.append(c)
+    if saved is None:
+        return constraints, None
+    return tuple(remaining), saved
+
+
+def _cached_randomize_with(item, constraints):
+    """
+    Randomizes `item` with the given constraints tuple. Calls with no real
+    constraints are routed to the cheaper `randomize()` (crv would otherwise
+    reject non-callable placeholders such as `[]` or `{}`), and the
+    constraint-tuple inspection is cached per call site so that repeated
+    invocations with an identical constraint signature skip it.
+
+    Args:
+        item (UVMSequenceItem|UVMSequence): Item to randomize.
+        constraints (tuple): Constraint lambdas (possibly with placeholders).
+    Returns:
+        bool: True if randomization succeeded.
+    """
+    if len(constraints) == 0:
+        return item.randomize()
+
+    key = None
+    if not any(_captures_mutable(c) for c in constraints if callable(c)):
+        key = (type(item), tuple(id(getattr(c, '__code__', None))
+            for c in constraints))
+
+    idx = None
+    if key is not None:
+        idx = _randomize_with_cache.get(key)
+    if idx is None:
+        idx = tuple(i for i, c in enumerate(constraints) if callable(c))
+        if key is not None:
+            _randomize_with_cache[key] = idx
+
+    if len(idx) == 0:
+        return item.randomize()
+    if len(idx) < len(constraints):
+        constraints = tuple(constraints[i] for i in idx)
+
+    constraints, saved_domains = _bind_eq_constraints(item, constraints)
+    try:
+        if len(constraints) == 0:
+            return item.randomize()
+        if JIT_ENABLED:
+            constraints = tuple(jit_constraint(c) for c in constraints)
+        return item.randomize_with(*constraints)
+    finally:
+        if saved_domains is not None:
+            item._randVariables.update(saved_domains)
 
 
 def uvm_create(seq_obj, SEQ_OR_ITEM, m_sequencer):
@@ -89,8 +277,31 @@ async def uvm_do(seq_obj, SEQ_OR_ITEM):
        this.post_do(sub_seq)       (func)
        sub_seq.post_start()        (task)
    """
-    
-    await uvm_do_on_pri_with(seq_obj, SEQ_OR_ITEM, seq_obj.m_sequencer, -1, [])
+
+    await _uvm_do_impl(seq_obj, SEQ_OR_ITEM, seq_obj.m_sequencer, -1, ())
+
+
+async def uvm_do_no_rand(seq_obj, SEQ_OR_ITEM, SEQR=None, PRIORITY=-1):
+    """
+    Specialized variant of `uvm_do` for items and sequences that must not be
+    randomized at all: create on the sequencer (or ~SEQR~, if given) and
+    execute directly, with no constraint handling and no randomize call.
+    This is the fully pre-populated-item counterpart of `uvm_do`.
+
+    Args:
+        seq_obj (UVMSequence): Sequence from which the function is called
+        SEQ_OR_ITEM (UVMSequence|UVMSequenceItem):
+        SEQR (UVMSequencer): Optional sequencer to run on.
+        PRIORITY (int): Priority of the sequence/item.
+    """
+    if SEQR is None:
+        SEQR = seq_obj.m_sequencer
+    _seq = uvm_create_on(seq_obj, SEQ_OR_ITEM, SEQR)
+    if _seq is not None and _seq._is_uvm_sequence:
+        await SEQ_OR_ITEM.start(SEQR, seq_obj, PRIORITY, 0)
+    else:
+        await seq_obj.start_item(SEQ_OR_ITEM, PRIORITY)
+        await seq_obj.finish_item(SEQ_OR_ITEM, PRIORITY)
 
 
 #// MACRO: `uvm_do_pri
@@ -110,8 +321,24 @@ async def uvm_do_with(seq_obj, SEQ_OR_ITEM, *CONSTRAINTS):
     argument is applied to the item or sequence in a randomize with statement
     before execution.
     """
-    await uvm_do_on_pri_with(seq_obj, SEQ_OR_ITEM, seq_obj.m_sequencer, -1,
-            *CONSTRAINTS)
+    await _uvm_do_impl(seq_obj, SEQ_OR_ITEM, seq_obj.m_sequencer, -1,
+            CONSTRAINTS)
+
+
+async def uvm_do_with_maybe_send(seq_obj, SEQ_OR_ITEM, *CONSTRAINTS):
+    """
+    This is the same as `uvm_do_with` for sequences that need constrained
+    randomization. Sequences that pre-populate every field of the item can
+    set the class attribute `_needs_randomize = False`, in which case the
+    item is sent through the pure `uvm_send` path (start_item/finish_item,
+    no randomize), skipping the solver entirely on the hot path.
+    """
+    if getattr(seq_obj, '_needs_randomize', True) is False:
+        SEQ_OR_ITEM.do_not_randomize = 1
+        await uvm_send(seq_obj, SEQ_OR_ITEM)
+    else:
+        await _uvm_do_impl(seq_obj, SEQ_OR_ITEM, seq_obj.m_sequencer, -1,
+                CONSTRAINTS)
 
 
 async def uvm_do_pri_with(seq_obj, SEQ_OR_ITEM, PRIORITY, *CONSTRAINTS):
@@ -120,8 +347,8 @@ async def uvm_do_pri_with(seq_obj, SEQ_OR_ITEM, PRIORITY, *CONSTRAINTS):
     applied to the item or sequence in a randomize with statement before
     execution.
     """
-    await uvm_do_on_pri_with(seq_obj, SEQ_OR_ITEM, seq_obj.m_sequencer,
-            PRIORITY, *CONSTRAINTS)
+    await _uvm_do_impl(seq_obj, SEQ_OR_ITEM, seq_obj.m_sequencer,
+            PRIORITY, CONSTRAINTS)
 
 
 """
@@ -138,7 +365,16 @@ def uvm_create_on(seq_obj, SEQ_OR_ITEM, SEQR):
     This is the same as <`uvm_create> except that it also sets the parent sequence
     to the sequence in which the macro is invoked, and it sets the sequencer to
     the specified ~SEQR~ argument.
+
+    When ~SEQ_OR_ITEM~ is already a constructed item or sequence (the common
+    case in the uvm_do_* actions, where callers pass `self.req` or a sequence
+    built in `__init__`), the object is reused and only its parent sequence
+    and sequencer are (re-)initialized; the factory round-trip is reserved
+    for type wrappers.
     """
+    if not isinstance(SEQ_OR_ITEM, type) and hasattr(SEQ_OR_ITEM, 'set_item_context'):
+        SEQ_OR_ITEM.set_item_context(seq_obj, SEQR)
+        return SEQ_OR_ITEM
     w_ = SEQ_OR_ITEM.get_type()
     if w_ is None:
         uvm_fatal("uvm_create_on",
@@ -154,7 +390,7 @@ async def uvm_do_on(seq_obj, SEQ_OR_ITEM, SEQR):
     the sequence in which the macro is invoked, and it sets the sequencer to the
     specified ~SEQR~ argument.
     """
-    await uvm_do_on_pri_with(seq_obj, SEQ_OR_ITEM, SEQR, -1, {})
+    await _uvm_do_impl(seq_obj, SEQ_OR_ITEM, SEQR, -1, ())
 
 
 #// MACRO: `uvm_do_on_pri
@@ -186,8 +422,7 @@ async def uvm_do_on_with(seq_obj, SEQ_OR_ITEM, SEQR, *CONSTRAINTS):
     Note that variables used in lambdas must exist, or an exception is thrown
     due to randomization error.
     """
-    await uvm_do_on_pri_with(seq_obj, SEQ_OR_ITEM, SEQR, -1,
-            *CONSTRAINTS)
+    await _uvm_do_impl(seq_obj, SEQ_OR_ITEM, SEQR, -1, CONSTRAINTS)
 
 #`define uvm_do_on_pri_with(SEQ_OR_ITEM, SEQR, PRIORITY, CONSTRAINTS) \
 #  begin \
@@ -212,19 +447,31 @@ async def uvm_do_on_pri_with(seq_obj, SEQ_OR_ITEM, SEQR, PRIORITY, *CONSTRAINTS)
         SEQR (UVMSequencer): Runs sequence on this sequencer.
         CONSTRAINTS (constraints): Randomization constraints
     """
-    from ..seq.uvm_sequence import UVMSequence
-    _seq = uvm_create_on(seq_obj, SEQ_OR_ITEM, SEQR)
-    if isinstance(_seq, UVMSequence):
+    await _uvm_do_impl(seq_obj, SEQ_OR_ITEM, SEQR, PRIORITY, CONSTRAINTS)
+
+
+async def _uvm_do_impl(seq_obj, SEQ_OR_ITEM, SEQR, PRIORITY, CONSTRAINTS,
+        _create=uvm_create_on, _randomize=_cached_randomize_with,
+        _warning=uvm_warning):
+    """
+    Internal implementation behind the uvm_do_* wrappers. Takes the
+    constraints as one tuple instead of varargs, so the wrapper chain
+    (uvm_do -> uvm_do_with -> uvm_do_on_pri_with) does not re-collect and
+    re-splat a fresh argument tuple at every hop. The trailing defaults
+    bind the module-level helpers as fast locals, replacing a module-dict
+    lookup per name per transaction; they are not part of the API.
+    """
+    _seq = _create(seq_obj, SEQ_OR_ITEM, SEQR)
+    if _seq is not None and _seq._is_uvm_sequence:
         if SEQ_OR_ITEM.do_not_randomize == 0:
-            if SEQ_OR_ITEM.randomize_with(*CONSTRAINTS) is False:
-                uvm_warning("RNDFLD", "Randomization failed in uvm_do_with action")
+            if _randomize(SEQ_OR_ITEM, CONSTRAINTS) is False:
+                _warning("RNDFLD", "Randomization failed in uvm_do_with action")
         await SEQ_OR_ITEM.start(SEQR, seq_obj, PRIORITY, 0)
     else:
-        # TODO handle constraints
-        await seq_obj.start_item(SEQ_OR_ITEM, PRIORITY)
-        if SEQ_OR_ITEM.randomize_with(*CONSTRAINTS) is False:
-            uvm_warning("RNDFLD", "Randomization failed in uvm_do_with action")
-        await seq_obj.finish_item(SEQ_OR_ITEM, PRIORITY)
+        def _randomize_cb():
+            if _randomize(SEQ_OR_ITEM, CONSTRAINTS) is False:
+                _warning("RNDFLD", "Randomization failed in uvm_do_with action")
+        await seq_obj.execute_item(SEQ_OR_ITEM, PRIORITY, _randomize_cb)
 
 
 """
@@ -269,15 +516,34 @@ async def uvm_send_pri(seq_obj, SEQ_OR_ITEM, PRIORITY):
         SEQ_OR_ITEM (UVMSequence|UVMSequenceItem): 
         PRIORITY (int): Priority of the sequence
     """
-    from ..seq.uvm_sequence import UVMSequence
     _seq = SEQ_OR_ITEM
-    if isinstance(_seq, UVMSequence):
+    if _seq._is_uvm_sequence:
         await _seq.start(_seq.get_sequencer(), seq_obj, PRIORITY, 0)
     else:
         await seq_obj.start_item(SEQ_OR_ITEM, PRIORITY)
         await seq_obj.finish_item(SEQ_OR_ITEM, PRIORITY)
 
 
+async def uvm_do_batch(seq_obj, items, PRIORITY=-1):
+    """
+    Processes a list of pre-built sequence items back-to-back. Each item is
+    driven through start_item/finish_item directly, without re-entering the
+    per-item `uvm_do` wrappers, without the factory create and without
+    randomization. The bound methods are looked up once for the whole batch,
+    so bursts of items pay the wrapper overhead only once.
+
+    Args:
+        seq_obj (UVMSequence): Sequence context.
+        items (list): Pre-built sequence items to send, in order.
+        PRIORITY (int): Priority for each item.
+    """
+    start_item = seq_obj.start_item
+    finish_item = seq_obj.finish_item
+    for item in items:
+        await start_item(item, PRIORITY)
+        await finish_item(item, PRIORITY)
+
+
 #// MACRO: `uvm_rand_send
 #//
 #//| `uvm_rand_send(SEQ_OR_ITEM)
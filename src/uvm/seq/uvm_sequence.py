@@ -31,6 +31,10 @@ class UVMSequence(UVMSequenceBase):
     streams of sequence items and/or other sequences.
     """
 
+    #// Type tag checked by the uvm_do_*/uvm_send_* dispatch instead of
+    #// isinstance(); see UVMSequenceItem for the item-side default.
+    _is_uvm_sequence = True
+
     def __init__(self, name="uvm_sequence"):
         """
         Variable: req
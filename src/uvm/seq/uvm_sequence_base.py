@@ -1060,6 +1060,48 @@ class UVMSequenceBase(UVMSequenceItem):
         sequencer.end_tr(item)
         self.post_do(item)
 
+    async def execute_item(self, item, set_priority=-1, randomize_cb=None):
+        """
+        Runs the complete start_item/finish_item handshake for `item` inside
+        a single coroutine frame. The optional `randomize_cb` is invoked
+        between the sequencer grant and the send, which is the
+        late-randomization point of the start_item/finish_item pair. The
+        pre_do/mid_do/post_do callbacks are issued exactly as in the split
+        calls; awaiting one coroutine instead of two saves a scheduler
+        round-trip per item on hot sequence paths.
+
+        Args:
+            item (UVMSequenceItem): Item to execute.
+            set_priority (int): Priority for the item.
+            randomize_cb (callable): Optional callback randomizing the item.
+        """
+        if item is None:
+            uvm_fatal("NoneITM",
+               "attempting to start a None item from sequence " + self.get_full_name())
+            return
+
+        sequencer = item.get_sequencer()
+        if sequencer is None:
+            sequencer = self.get_sequencer()
+        if sequencer is None:
+            uvm_fatal("SEQ", SEQ_ERR1_MSG + self.get_full_name())
+            return
+
+        item.set_item_context(self, sequencer)
+
+        if set_priority < 0:
+            set_priority = self.get_priority()
+
+        await sequencer.wait_for_grant(self, set_priority)
+        self.pre_do(1)
+        if randomize_cb is not None:
+            randomize_cb()
+        self.mid_do(item)
+        sequencer.send_request(self, item)
+        await sequencer.wait_for_item_done(self, -1)
+        sequencer.end_tr(item)
+        self.post_do(item)
+
     #  // Task: wait_for_grant
     #  //
     #  // This task issues a request to the current sequencer.  If item_priority is
@@ -1284,6 +1326,29 @@ class UVMSequenceBase(UVMSequenceItem):
                        self.m_resp_queue_event)
 
 
+    async def get_responses(self, response_list, n):
+        """
+          Function: get_responses
+
+          Retrieves the next ~n~ responses from this sequence's response
+          queue, appending them to ~response_list~ in arrival order. Queued
+          responses are drained without yielding between pops, so a sequence
+          that has issued ~n~ requests pays at most one scheduler round-trip
+          per queue refill instead of one per `get_response` call.
+
+        Args:
+            response_list: List the responses are appended to.
+            n: Number of responses to retrieve.
+        """
+        while n > 0:
+            if self.response_queue.size() == 0:
+                await wait(lambda: self.response_queue.size() != 0,
+                     self.m_resp_queue_event)
+            while n > 0 and self.response_queue.size() > 0:
+                response_list.append(self.response_queue.pop_front())
+                n -= 1
+
+
     def m_get_sqr_sequence_id(self, sequencer_id, update_sequence_id):
         """
           m_get_sqr_sequence_id
@@ -49,6 +49,11 @@ class UVMSequenceItem(UVMTransaction):
     issued1 = False
     issued2 = False
 
+    #// Type tag used by the uvm_do_*/uvm_send_* functions to dispatch between
+    #// the item and sequence paths with a plain attribute load instead of an
+    #// isinstance() MRO walk. `UVMSequence` overrides this with True.
+    _is_uvm_sequence = False
+
     def __init__(self, name="UVMSequenceItem") -> None:
         """
         Function: new
@@ -66,6 +71,7 @@ class UVMSequenceItem(UVMTransaction):
         self.p_sequencer: UVMSequenceBase = None
         self.m_parent_sequence = None
         self.print_sequence_info = False
+        self._cached_sequence_path = None
     #  endfunction
 
     def get_type_name(self) -> str:
@@ -201,6 +207,8 @@ class UVMSequenceItem(UVMTransaction):
     #  // the source sequence of a sequence_item.
 
     def set_parent_sequence(self, parent: UVMSequenceBase) -> None:
+        if parent is not self.m_parent_sequence:
+            self._cached_sequence_path = None
         self.m_parent_sequence = parent
 
 
@@ -339,8 +347,15 @@ class UVMSequenceItem(UVMTransaction):
         Provides a string of names of each sequence in the full hierarchical
         path. A "." is used as the separator between each sequence.
 
+        The result is cached on the instance and invalidated by
+        `set_parent_sequence`, since sequences typically log the path on
+        every transaction while the parent chain changes at most once per
+        `UVMSequenceBase.start`.
+
         Returns:
         """
+        if self._cached_sequence_path is not None:
+            return self._cached_sequence_path
         this_item = None  # UVMSequenceItem
         seq_path = ""
         this_item = self
@@ -350,6 +365,7 @@ class UVMSequenceItem(UVMTransaction):
                 this_item = this_item.get_parent_sequence()
                 seq_path = this_item.get_name() + "." + seq_path
             else:
+                self._cached_sequence_path = seq_path
                 return seq_path
 
 
@@ -294,7 +294,7 @@ class ubus_bus_monitor(UVMMonitor):
         elif sig_size == 3:
             self.trans_collected.size = 8
 
-        self.trans_collected.data = [0] * self.trans_collected.size
+        self.trans_collected.data = bytearray(self.trans_collected.size)
 
         vec = int((int(self.vif.sig_read) << 1) & int(self.vif.sig_write))
         if vec == 0:
@@ -330,7 +330,7 @@ class ubus_bus_monitor(UVMMonitor):
                     await RisingEdge(self.vif.sig_clock)
                     if self.vif.sig_wait == 0:
                         break
-                self.trans_collected.data[i] = self.vif.sig_data
+                self.trans_collected.data[i] = int(self.vif.sig_data)
             self.num_transactions += 1
             self.end_tr(self.trans_collected)
         else:
@@ -167,7 +167,7 @@ class ubus_master_driver(UVMDriver):
             if trans.read_write == READ:
                 arr = []
                 await self.read_byte(arr, err)
-                trans.data[i] = arr[0]
+                trans.data[i] = int(arr[0])
             else:
                 await self.write_byte(trans.data[i], err)
 
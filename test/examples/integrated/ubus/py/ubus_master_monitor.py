@@ -190,7 +190,7 @@ class ubus_master_monitor(UVMMonitor):
             self.trans_collected.size = 4
         elif sig_size == 3:
             self.trans_collected.size = 8
-        self.trans_collected.data = [0] * self.trans_collected.size
+        self.trans_collected.data = bytearray(self.trans_collected.size)
 
         sig_read = int(self.vif.sig_read)
         sig_write = int(self.vif.sig_write)
@@ -213,7 +213,7 @@ class ubus_master_monitor(UVMMonitor):
                     await RisingEdge(self.vif.sig_clock)
                     if self.vif.sig_wait.value == 0:
                         break
-                self.trans_collected.data[i] = self.vif.sig_data.value
+                self.trans_collected.data[i] = int(self.vif.sig_data.value)
         self.end_tr(self.trans_collected)
     #  endtask : collect_data_phase
 
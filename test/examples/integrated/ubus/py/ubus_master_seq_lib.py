@@ -23,10 +23,16 @@
 from uvm.seq import UVMSequence
 from uvm.macros.uvm_object_defines import uvm_object_utils
 from uvm.macros.uvm_message_defines import uvm_info
-from uvm.macros.uvm_sequence_defines import uvm_do_with
-from uvm.base import sv, UVM_HIGH
+from uvm.macros.uvm_sequence_defines import uvm_do_with_maybe_send
+from uvm.base import UVM_HIGH
 from ubus_transfer import ubus_transfer, READ, WRITE
 
+#// Bound str.format closures for the hot log messages. sv.sformatf re-parses
+#// its printf-style template on every call; these templates are constant, so
+#// they are compiled to a single C-level str.format call at import time.
+_READ_FMT = "{} read : addr = 0x{:x}, data[0] = 0x{:x}".format
+_WRITE_FMT = "{} wrote : addr = 0x{:x}, data[0] = 0x{:x}".format
+
 #//------------------------------------------------------------------------------
 #//
 #// SEQUENCE: ubus_base_sequence
@@ -41,8 +47,31 @@ class ubus_base_sequence(UVMSequence):
     def __init__(self, name="ubus_base_seq"):
         UVMSequence.__init__(self, name)
         self.set_automatic_phase_objection(1)
-        self.req = ubus_transfer()
-        self.rsp = ubus_transfer()
+
+    #// req/rsp are allocated lazily on first access, so sub-sequences that
+    #// never touch them skip two ubus_transfer constructions per instance.
+    #// UVMSequence.__init__ assigns req/rsp = None, which lands in the
+    #// setters below.
+
+    @property
+    def req(self):
+        if self._req is None:
+            self._req = ubus_transfer()
+        return self._req
+
+    @req.setter
+    def req(self, value):
+        self._req = value
+
+    @property
+    def rsp(self):
+        if self._rsp is None:
+            self._rsp = ubus_transfer()
+        return self._rsp
+
+    @rsp.setter
+    def rsp(self, value):
+        self._rsp = value
 
 #//------------------------------------------------------------------------------
 #//
@@ -53,23 +82,38 @@ class ubus_base_sequence(UVMSequence):
 
 class read_byte_seq(ubus_base_sequence):
 
+    #// body() assigns every field of the request before handing it over, so
+    #// the item goes through the uvm_send fast path without a solver call.
+    _needs_randomize = False
+
+    #// Shared randomization domain for start_addr. Built once at class scope
+    #// so each sequence construction references it instead of rebuilding it.
+    _START_ADDR_DOMAIN = range((1 << 12) - 1)
+
     def __init__(self, name="read_byte_seq"):
         ubus_base_sequence.__init__(self, name)
         self.start_addr = 0
-        self.rand('start_addr', range((1 << 12) - 1))
+        self.rand('start_addr', read_byte_seq._START_ADDR_DOMAIN)
         self.transmit_delay = 0
+        #// Constraint lambdas close over self, so they are built once here
+        #// instead of once per body() call. This also keeps their code-object
+        #// ids stable, so the randomize-with call-site cache stays hot.
+        self._body_constraints = (
+            lambda addr: addr == self.start_addr,
+        )
 
     #  constraint transmit_del_ct { (transmit_del <= 10); }
 
 
     async def body(self):
-        self.req.data = [1234]
+        self.req.data = bytearray(1)
         self.req.addr = self.start_addr
         self.req.read_write = READ
         self.req.size = 1
         self.req.error_pos = 1000
         self.req.transmit_delay = self.transmit_delay
-        await uvm_do_with(self, self.req, lambda addr: addr == self.start_addr)
+        await uvm_do_with_maybe_send(self, self.req,
+            *self._body_constraints)
         #      { req.addr == start_addr
         #        req.read_write == READ
         #        req.size == 1
@@ -79,14 +123,62 @@ class read_byte_seq(ubus_base_sequence):
         await self.get_response(rsp)
         self.rsp = rsp[0]
         uvm_info(self.get_name(),
-            sv.sformatf("%s read : addr = `x{}, data[0] = `x{}",
-                self.get_sequence_path(), self.rsp.addr, self.rsp.data[0]),
+            lambda: _READ_FMT(self.get_sequence_path(), self.rsp.addr,
+                self.rsp.data[0]),
             UVM_HIGH)
 
 
 uvm_object_utils(read_byte_seq)
 
 
+#//------------------------------------------------------------------------------
+#//
+#// SEQUENCE: read_burst_seq
+#//
+#//------------------------------------------------------------------------------
+
+class read_burst_seq(ubus_base_sequence):
+
+    #// Issues `count` single-byte reads from consecutive addresses and then
+    #// collects all the responses with one get_responses call, instead of
+    #// awaiting get_response after every read.
+
+    _needs_randomize = False
+
+    _START_ADDR_DOMAIN = range(1 << 16)
+
+    def __init__(self, name="read_burst_seq"):
+        ubus_base_sequence.__init__(self, name)
+        self.start_addr = 0
+        self.rand('start_addr', read_burst_seq._START_ADDR_DOMAIN)
+        self.count = 1
+        self.transmit_delay = 0
+
+    async def body(self):
+        #// The default response queue holds 8 entries; the whole burst is
+        #// drained at the end, so the queue must hold all of it.
+        self.set_response_queue_depth(-1)
+        req = self.req
+        for i in range(self.count):
+            req.data = bytearray(1)
+            req.addr = self.start_addr + i
+            req.read_write = READ
+            req.size = 1
+            req.error_pos = 1000
+            req.transmit_delay = self.transmit_delay
+            await uvm_do_with_maybe_send(self, req)
+        rsps = []
+        await self.get_responses(rsps, self.count)
+        self.rsp = rsps[-1]
+        uvm_info(self.get_name(),
+            lambda: _READ_FMT(self.get_sequence_path(), self.rsp.addr,
+                self.rsp.data[0]) + " ({} reads)".format(self.count),
+            UVM_HIGH)
+
+
+uvm_object_utils(read_burst_seq)
+
+
 #//------------------------------------------------------------------------------
 #//
 #// SEQUENCE: read_half_word_seq
@@ -205,27 +297,38 @@ class write_byte_seq(ubus_base_sequence):
 
     last_data = None
 
+    #// As in read_byte_seq, all fields are set in body() before sending.
+    _needs_randomize = False
+
+    _START_ADDR_DOMAIN = range(1 << 16)
+
     def __init__(self, name="write_byte_seq"):
         ubus_base_sequence.__init__(self, name)
         self.start_addr = 0
-        self.rand('start_addr', range(1 << 16))
+        self.rand('start_addr', write_byte_seq._START_ADDR_DOMAIN)
         self.data0 = 0
         self.transmit_delay = 0
+        self.req.data = bytearray(1)
+        #// Built once per sequence, as in read_byte_seq.
+        self._body_constraints = (
+            lambda addr: addr == self.start_addr,
+            lambda read_write: read_write == WRITE,
+            lambda data: data[0] == self.data0,
+        )
 
     #  constraint transmit_del_ct { (transmit_del <= 10); }
 
 
     async def body(self):
-        req = ubus_transfer()
-        req.data.append(self.data0)
+        req = self.req
+        req.data[0] = self.data0
         req.addr = self.start_addr
         req.size = 1
         req.error_pos = 1000
         req.read_write = WRITE
         req.transmit_delay = self.transmit_delay
-        await uvm_do_with(self, req, lambda addr: addr == self.start_addr,
-            lambda read_write: read_write == WRITE,
-            lambda data: data[0] == self.data0)
+        await uvm_do_with_maybe_send(self, req,
+            *self._body_constraints)
         #      { req.addr == start_addr
         #        req.read_write == WRITE
         #        req.size == 1
@@ -233,14 +336,56 @@ class write_byte_seq(ubus_base_sequence):
         #        req.error_pos == 1000
         #        req.transmit_delay == transmit_del; } )
         uvm_info(self.get_type_name(),
-            sv.sformatf("%s wrote : addr = `x%0h, data[0] = `x%0h",
-            self.get_sequence_path(), req.addr, req.data[0]), UVM_HIGH)
+            lambda: _WRITE_FMT(self.get_sequence_path(), req.addr,
+                req.data[0]), UVM_HIGH)
         write_byte_seq.last_data = req.data[0]
 
 
 uvm_object_utils(write_byte_seq)
 
 
+#//------------------------------------------------------------------------------
+#//
+#// SEQUENCE: write_burst_seq
+#//
+#//------------------------------------------------------------------------------
+
+class write_burst_seq(ubus_base_sequence):
+
+    #// Drives all the bytes in `data` as one multi-beat WRITE transfer. The
+    #// driver already drives trans.size beats per data phase, so staging the
+    #// whole burst into a single item pays the sequencer round-trip once per
+    #// burst instead of once per byte. The burst length must be a legal ubus
+    #// transfer size (1, 2, 4 or 8).
+
+    _needs_randomize = False
+
+    _START_ADDR_DOMAIN = range(1 << 16)
+
+    def __init__(self, name="write_burst_seq"):
+        ubus_base_sequence.__init__(self, name)
+        self.start_addr = 0
+        self.rand('start_addr', write_burst_seq._START_ADDR_DOMAIN)
+        self.data = []
+        self.transmit_delay = 0
+
+    async def body(self):
+        req = self.req
+        req.data = bytearray(self.data)
+        req.addr = self.start_addr
+        req.size = len(req.data)
+        req.error_pos = 1000
+        req.read_write = WRITE
+        req.transmit_delay = self.transmit_delay
+        await uvm_do_with_maybe_send(self, req)
+        uvm_info(self.get_type_name(),
+            lambda: _WRITE_FMT(self.get_sequence_path(), req.addr,
+                req.data[0]) + " ({} beats)".format(req.size), UVM_HIGH)
+
+
+uvm_object_utils(write_burst_seq)
+
+
 #//------------------------------------------------------------------------------
 #//
 #// SEQUENCE: write_half_word_seq
@@ -212,7 +212,7 @@ class ubus_slave_monitor(UVMMonitor):
                     elif self.vif.sig_size.value == 3:
                         self.trans_collected.size = 8
 
-                    self.trans_collected.data = [0] * self.trans_collected.size
+                    self.trans_collected.data = bytearray(self.trans_collected.size)
 
                     if self.vif.sig_read.value == 0 and self.vif.sig_write.value == 0:
                         self.trans_collected.read_write = NOP
@@ -233,7 +233,7 @@ class ubus_slave_monitor(UVMMonitor):
                     await RisingEdge(self.vif.sig_clock)
                     if self.vif.sig_wait.value == 0:
                         break
-                self.trans_collected.data[i] = self.vif.sig_data.value
+                self.trans_collected.data[i] = int(self.vif.sig_data.value)
         self.end_tr(self.trans_collected)
         #  endtask : collect_data_phase
 
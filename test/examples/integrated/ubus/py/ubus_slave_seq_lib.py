@@ -102,7 +102,7 @@ class slave_memory_seq(UVMSequence):
         self.req.read_write = self.util_transfer.read_write
         self.req.error_pos  = 1000
         self.req.transmit_delay = 0
-        self.req.data = [0] * self.util_transfer.size
+        self.req.data = bytearray(self.util_transfer.size)
         self.req.wait_state = [0] * self.util_transfer.size
         for i in range(self.util_transfer.size):
             self.req.wait_state[i] = 2
@@ -112,7 +112,7 @@ class slave_memory_seq(UVMSequence):
                 new_addr = self.util_transfer.addr + i
                 if new_addr not in self.m_mem:
                     self.m_mem[new_addr] = sv.urandom()
-                self.req.data[i] = self.m_mem[new_addr]
+                self.req.data[i] = self.m_mem[new_addr] & 0xFF
 
 
     def post_do(self, this_item):
@@ -59,7 +59,9 @@ class ubus_transfer(UVMSequenceItem):
         self.rand("read_write", [READ, WRITE])
         self.size = 0
         self.rand("size", [1, 2, 4, 8])
-        self.data = []
+        #// The data beats live in a bytearray: one contiguous 8-bit buffer
+        #// instead of a list of boxed ints, sized to the 8-bit ubus data bus.
+        self.data = bytearray()
         #self.rand("data")
         self.wait_state = []
         #self.rand("wait_state")
@@ -74,18 +76,17 @@ class ubus_transfer(UVMSequenceItem):
 
     def post_randomize(self):
         self.wait_state = []
-        self.data = []
+        self.data = bytearray(self.size)
         for i in range(self.size):
             self.wait_state.append(sv.urandom_range(0, 1))
-            self.data.append(sv.urandom_range(1, 1 << 8))
+            self.data[i] = sv.urandom_range(0, 0xFF)
 
 
     def do_copy(self, rhs):
         self.addr = rhs.addr
         self.read_write = rhs.read_write
         self.size = rhs.size
-        for val in rhs.data:
-            self.data.append(val)
+        self.data.extend(rhs.data)
         for val in rhs.wait_state:
             self.wait_state.append(val)
 
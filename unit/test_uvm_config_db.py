@@ -2,6 +2,8 @@
 import unittest
 from uvm.base.uvm_config_db import UVMConfigDb, UVMConfigDbOptions
 from uvm.base.uvm_debug import UVMDebug
+from uvm.base.uvm_resource import UVMResourcePool
+from uvm.base.uvm_resource_db import UVMResourceDb
 
 str1 = "uvm_test_top.ubus_example_tb0.ubus0.masters[0].monitor"
 
@@ -10,6 +12,23 @@ str1 = "uvm_test_top.ubus_example_tb0.ubus0.masters[0].monitor"
 
 class TestUVMConfigDb(unittest.TestCase):
 
+    def setUp(self):
+        # UVMConfigDb keeps class-level state (and pools cached on the
+        # context components); reset everything so tests stay independent
+        # and do not accumulate resources across runs
+        for cntxt in list(UVMConfigDb.m_rsc.keys()):
+            if hasattr(cntxt, '_cfg_pool'):
+                del cntxt._cfg_pool
+        UVMConfigDb.m_rsc.clear()
+        UVMConfigDb.m_waiters.clear()
+        UVMConfigDb._get_cache.clear()
+        UVMConfigDb._resource_cache.clear()
+        UVMConfigDb._db_version += 1
+        rp = UVMResourcePool.get()
+        rp.rtab.delete()
+        rp.ttab.clear()
+        UVMConfigDbOptions.turn_off_tracing()
+
     def test_exists(self):
         pass
         # ok = True
@@ -51,6 +70,19 @@ class TestUVMConfigDb(unittest.TestCase):
         self.assertEqual(arr[0], 666)
 
 
+    def test_get_sees_resource_db_set(self):
+        # A get() miss must not stick: resources added through the
+        # resource-db API (bypassing UVMConfigDb.set) have to invalidate
+        # the get cache
+        got_val = []
+        ok = UVMConfigDb.get(None, "top.env", "field1", got_val, T=None)
+        self.assertEqual(ok, False)
+        UVMResourceDb.set("top.env", "field1", 123)
+        got_val = []
+        ok = UVMConfigDb.get(None, "top.env", "field1", got_val, T=None)
+        self.assertEqual(ok, True)
+        self.assertEqual(got_val[0], 123)
+
     def test_set_override(self):
         pass
         # self.assertEqual(0, 1)